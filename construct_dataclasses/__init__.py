@@ -14,10 +14,13 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
 
+import collections
 import dataclasses
 import inspect
 import textwrap
 import enum
+import functools
+import io
 import sys
 
 import construct as cs
@@ -40,6 +43,7 @@ def subcsfield(
     subcon,
     doc: str | None = None,
     parsed=None,
+    numpy=False,
 ) -> dataclasses.Field:
     """
     Helper method to define `cs.Subconstruct` fields in a dataclass that reference another
@@ -59,16 +63,34 @@ def subcsfield(
     "Construct" or "SubConstruct". The easiest approach is to use `to_struct(...)` (also exported
     by this package).
 
+    If `numpy` is set to True, an `Array` of fixed-size structs that only contain
+    primitive number fields (e.g. `Int8ub` or `Float32l`) will be parsed at once
+    into a NumPy structured array instead of a list of objects. This requires
+    the `numpy` package to be installed::
+
+        >>> @dataclasses.dataclass
+        >>> class Blob:
+        ...     blobs: np.ndarray = subcsfield(
+        ...         InnerBlob, Array(3, to_struct(InnerBlob)), numpy=True
+        ...     )
+        ...
+
     :param model: the dataclass type
     :type model: type
     :param subcon: the sub-construct
     :type subcon: Construct | SubConstruct
+    :param numpy: whether the array should be parsed into a NumPy array, defaults to False
+    :type numpy: bool, optional
     :return: the created dataclasses Field
     :rtype: dataclasses.Field
     """
     if not dataclasses.is_dataclass(model):
         raise TypeError(f"Provided class {model} is not a dataclass!")
 
+    if numpy:
+        subcon = _NumpyArray(subcon)
+        model = type(subcon)
+
     return _process_csfield(
         model=model,
         subcon=subcon,
@@ -162,6 +184,14 @@ def tfield(
     return _process_csfield(model, subcon, doc, parsed)
 
 
+# Functions that return the default value of a field based on the exact
+# type of its subcon.
+_DEFAULT_HANDLERS = {
+    cs.Const: lambda subcon: subcon.value,
+    cs.Default: lambda subcon: None if callable(subcon.value) else subcon.value,
+}
+
+
 def _process_csfield(
     # The model can be the actual model class (dataclass) or the type
     # of construct used.
@@ -185,13 +215,9 @@ def _process_csfield(
         default = dataclasses.MISSING
 
     # create default values
-    if isinstance(target_subcon, cs.Const):
-        default = target_subcon.value
-    elif isinstance(target_subcon, cs.Default):
-        if callable(target_subcon.value):
-            default = None
-        else:
-            default = target_subcon.value
+    handler = _DEFAULT_HANDLERS.get(type(target_subcon))
+    if handler is not None:
+        default = handler(target_subcon)
 
     return dataclasses.field(
         default=default,
@@ -227,39 +253,65 @@ def to_struct(
     if not inspect.isclass(model) or not dataclasses.is_dataclass(model):
         raise TypeError("Model must be a dataclass!")
 
-    return _to_struct_inner(
-        model, max_depth=depth, reverse=reverse, aligned=aligned, union=union
-    )
+    # Structs are cached per model class, so the same dataclass referenced
+    # from multiple parents shares one Struct instance. The type of 'union'
+    # is part of the key, because True and 1 would be considered equal.
+    cache = model.__dict__.get("__cd_struct_cache__")
+    if cache is None:
+        cache = {}
+        setattr(model, "__cd_struct_cache__", cache)
+
+    key = (depth, reverse, aligned, union, type(union))
+    try:
+        struct = cache.get(key)
+    except TypeError:
+        # Expressions such as 'this.x' can't be hashed and are therefore
+        # not cached.
+        return _to_struct_inner(
+            model, max_depth=depth, reverse=reverse, aligned=aligned, union=union
+        )
+
+    if struct is None:
+        struct = _to_struct_inner(
+            model, max_depth=depth, reverse=reverse, aligned=aligned, union=union
+        )
+        cache[key] = struct
+    return struct
 
 
 def _to_struct_inner(
-    obj, max_depth=None, depth=0, reverse=False, aligned=None, union=None
+    obj,
+    max_depth=None,
+    depth=0,
+    reverse=False,
+    aligned=None,
+    union=None,
+    zero_copy=False,
 ):
     if dataclasses.is_dataclass(obj):
-        fields = dataclasses.fields(obj)
-        if reverse:
-            fields = reversed(fields)
+        cache = _field_cache(obj)
+        fields = cache.fields_rev if reverse else cache.fields_fwd
 
-        subcon_fields = {}
-        for dc_field in fields:
+        subcons = []
+        for info in fields:
             if (max_depth is not None and depth < max_depth) or max_depth is None:
-                cs_field = _to_struct_inner(
-                    dc_field.metadata["subcon"], max_depth, depth + 1, reverse
-                )
+                cs_field = _to_struct_inner(info.subcon, max_depth, depth + 1, reverse)
             else:
-                cs_field = dc_field.metadata["subcon"]
+                cs_field = info.subcon
 
-            subcon_fields[dc_field.name] = cs_field
+            if zero_copy:
+                cs_field = _zero_copy_subcon(cs_field)
+            subcons.append(cs.Renamed(cs_field, newname=info.name))
         if aligned is not None:
-            return cs.AlignedStruct(aligned, **subcon_fields)
+            return cs.AlignedStruct(aligned, *subcons)
 
         if union is not None:
             parsefrom = union
             if union is True:
                 parsefrom = None
-            return cs.Union(parsefrom, **subcon_fields)
+            return cs.Union(parsefrom, *subcons)
 
-        return cs.Struct(**subcon_fields)
+        return cs.Struct(*subcons)
 
     elif isinstance(obj, cs.Construct):
         return obj
@@ -286,68 +338,317 @@ def to_object(obj: cs.Container | cs.ListContainer, model: type):
     if dataclasses.is_dataclass(obj):
         return obj
 
-    fields = dataclasses.fields(model)
+    is_list = isinstance(obj, cs.ListContainer)
     # We first have to extract all fields that are needed to instantiate
-    # the model class.
+    # the model class. All other fields are applied afterwards.
     init_fields = {}
-    for dc_field in fields:
-        if dc_field.init:
-            if isinstance(obj, cs.ListContainer):
-                value = [_to_object_inner(x, dc_field) for x in obj]
-            else:
-                value = obj.get(dc_field.name)
-            init_fields[dc_field.name] = _to_object_inner(value, dc_field)
+    noinit_fields = []
+    for info in _field_cache(model).fields_fwd:
+        if is_list:
+            value = [info.decode(x) for x in obj]
+        else:
+            value = obj.get(info.name)
+
+        if info.init:
+            init_fields[info.name] = info.decode(value)
+        else:
+            noinit_fields.append((info.name, info.decode(value)))
 
     instance = model(**init_fields)
-    # Now we can apply all other fields
-    for dc_field in fields:
-        if not dc_field.init:
-            if isinstance(obj, cs.ListContainer):
-                value = [_to_object_inner(x, dc_field) for x in obj]
-            else:
-                value = obj.get(dc_field.name)
-            setattr(instance, dc_field.name, _to_object_inner(value, dc_field))
+    for name, value in noinit_fields:
+        setattr(instance, name, value)
 
     return instance
 
 
-def _to_object_inner(value, field: dataclasses.Field):
-    # Check if we have an inner struct first
-    subcon_type = field.metadata["subcon_orig_type"]
+# Pre-resolved type information of a single dataclass field that is used
+# when converting parsed values back into objects.
+_FieldInfo = collections.namedtuple(
+    "_FieldInfo",
+    [
+        "name",
+        "init",
+        "subcon",
+        "is_dc",
+        "decode",
+    ],
+)
+
+
+def _field_info(field: dataclasses.Field) -> _FieldInfo:
+    orig_type = field.metadata["subcon_orig_type"]
     field_type = field.type
     if isinstance(field_type, str):
         # normal type annotations are stored as string
-        field_type = subcon_type
+        field_type = orig_type
+
+    # Allow list declarations of enum values. If there is a type hint
+    # with a list-like type, we can take the first type argument and use
+    # it as our enum type
+    enum_type = field_type
+    origin = getattr(field_type, "__origin__", None)
+    args = getattr(field_type, "__args__", None)
+    if inspect.isclass(origin) and issubclass(origin, list):
+        # bare annotations like typing.List have no usable type argument
+        if args and len(args) == 1 and inspect.isclass(args[0]):
+            (enum_type,) = args
+
+    is_dc = dataclasses.is_dataclass(orig_type)
+    is_intenum = inspect.isclass(enum_type) and issubclass(enum_type, enum.IntEnum)
+
+    # The decoder function is selected once, so that parsed values don't
+    # have to pass the whole chain of type checks.
+    if is_dc:
+        decode = functools.partial(_decode_dataclass, orig_type)
+    elif is_intenum:
+        decode = functools.partial(_decode_intenum, enum_type._value2member_map_)
+    elif _is_plain_subcon(field.metadata["subcon"]):
+        decode = _decode_passthrough
+    else:
+        decode = _decode_enumstr
+
+    return _FieldInfo(
+        name=field.name,
+        init=field.init,
+        subcon=field.metadata["subcon"],
+        is_dc=is_dc,
+        decode=decode,
+    )
+
+
+# All resolved fields of a dataclass in definition order, in reverse order
+# and grouped by whether they are passed to __init__.
+_ClassCache = collections.namedtuple(
+    "_ClassCache", ["fields_fwd", "fields_rev", "init_fields", "noinit_fields"]
+)
+
+
+def _field_cache(model: type) -> _ClassCache:
+    # dataclasses.fields() filters and copies the field list on every call,
+    # so we resolve all fields once and store them on the class. The class
+    # __dict__ is queried directly, because subclasses must not reuse the
+    # cache of their parent.
+    cache = model.__dict__.get("__cd_field_cache__")
+    if cache is None:
+        fields = tuple(_field_info(f) for f in dataclasses.fields(model))
+        cache = _ClassCache(
+            fields_fwd=fields,
+            fields_rev=fields[::-1],
+            init_fields=tuple(info for info in fields if info.init),
+            noinit_fields=tuple(info for info in fields if not info.init),
+        )
+        setattr(model, "__cd_field_cache__", cache)
+    return cache
+
+
+def _class_decoder(model: type):
+    decoder = model.__dict__.get("__cd_decode__")
+    if decoder is None:
+        decoder = _make_decoder(model)
+        setattr(model, "__cd_decode__", decoder)
+    return decoder
 
+
+def _make_decoder(model: type):
+    # Generates a function that converts a parsed container into an instance
+    # of the given model. The generated code contains one statement per field
+    # and therefore skips iterating over the field cache at runtime, e.g.:
+    #
+    #   def __cd_decode__(obj):
+    #       instance = __cd_model__(a=obj.get('a'), b=_dec_1(obj.get('b')))
+    #       instance.c = _dec_2(obj.get('c'))
+    #       return instance
+    #
+    # Values of plain fields are used directly. If there are no fields that
+    # have to be applied after the instance was created, the instance is
+    # returned directly.
+    cache = _field_cache(model)
+    namespace = {"__cd_model__": model}
+
+    def decode_expr(i: int, info: _FieldInfo) -> str:
+        value = f"obj.get({info.name!r})"
+        if info.decode is _decode_passthrough:
+            return value
+
+        namespace[f"_dec_{i}"] = info.decode
+        return f"_dec_{i}({value})"
+
+    args = [
+        f"{info.name}={decode_expr(i, info)}"
+        for i, info in enumerate(cache.init_fields)
+    ]
+    if not cache.noinit_fields:
+        lines = [
+            "def __cd_decode__(obj):",
+            f"    return __cd_model__({', '.join(args)})",
+        ]
+    else:
+        lines = [
+            "def __cd_decode__(obj):",
+            f"    instance = __cd_model__({', '.join(args)})",
+        ]
+        for i, info in enumerate(cache.noinit_fields, start=len(args)):
+            lines.append(f"    instance.{info.name} = {decode_expr(i, info)}")
+        lines.append("    return instance")
+
+    code = compile("\n".join(lines), f"<cd:{model.__name__}>", "exec")
+    exec(code, namespace)
+    return namespace["__cd_decode__"]
+
+
+def _is_plain_subcon(subcon) -> bool:
+    # Returns whether the given subcon parses into a value that can be
+    # returned as is, i.e. it won't produce lists or enum strings.
+    while isinstance(subcon, cs.Subconstruct):
+        if isinstance(subcon, (cs.Adapter, cs.Array, cs.GreedyRange, cs.RepeatUntil)):
+            return False
+        subcon = subcon.subcon
+
+    return isinstance(
+        subcon,
+        (
+            cs.FormatField,
+            cs.BytesInteger,
+            cs.BitsInteger,
+            cs.Bytes,
+            cs.GreedyBytes.__class__,
+            cs.Flag.__class__,
+            _NumpyArray,
+        ),
+    )
+
+
+def _decode_passthrough(value):
+    return value
+
+
+def _decode_dataclass(model: type, value):
+    if isinstance(value, cs.ListContainer):
+        return [_decode_dataclass(model, x) for x in value]
+
+    if value is None or dataclasses.is_dataclass(value):
+        # support optional types and already converted objects
+        return value
+
+    # Check if we have an inner struct first
+    return _class_decoder(model)(value)
+
+
+def _decode_intenum(enum_lookup: dict, value):
     if isinstance(value, cs.ListContainer):
-        return list(map(lambda x: _to_object_inner(x, field), value))
-    elif dataclasses.is_dataclass(subcon_type):
-        return to_object(value, subcon_type)
+        return [_decode_intenum(enum_lookup, x) for x in value]
     elif isinstance(value, cs.EnumIntegerString):
-        # Allow list declarations of enum values. If there is a type hint
-        # with a list-like type, we can take the first type argument and use
-        # it as our enum type
-        if hasattr(field_type, "__origin__") and issubclass(
-            field_type.__origin__, list
-        ):
-            (field_type,) = field_type.__args__
-
-        if issubclass(field_type, enum.IntEnum):
-            # Search for enum value within defined ones
-            for enum_val in field_type:
-                if enum_val.value == value.intvalue:
-                    return enum_val
+        # Search for enum value within defined ones
+        return enum_lookup.get(value.intvalue, value.intvalue)
 
-        else:
-            return value.intvalue
+    return value
+
+
+def _decode_enumstr(value):
+    if isinstance(value, cs.ListContainer):
+        return [_decode_enumstr(x) for x in value]
+    elif isinstance(value, cs.EnumIntegerString):
+        return value.intvalue
 
     return value
 
 
+def _class_encoder(model: type):
+    encoder = model.__dict__.get("__cd_encode__")
+    if encoder is None:
+        encoder = _make_encoder(model)
+        setattr(model, "__cd_encode__", encoder)
+    return encoder
+
+
+def _make_encoder(model: type):
+    # Shallow replacement for dataclasses.asdict(obj): values of plain
+    # sub-constructs are returned as is. All other fields may store (lists
+    # of) dataclass objects, whose sub-construct is a plain Struct that
+    # expects a dict-like object, so they are converted recursively. Byte
+    # fields may store memoryview objects (see DataclassStruct.parse_bytes),
+    # which are converted back to bytes. The generated function looks like
+    # this:
+    #
+    #   def __cd_encode__(obj):
+    #       return {'a': obj.a, 'b': _encode_dataclass(obj.b)}
+    items = []
+    for info in _field_cache(model).fields_fwd:
+        value = f"obj.{info.name}"
+        if info.is_dc or not _is_plain_subcon(info.subcon):
+            value = f"_encode_dataclass({value})"
+        elif _is_bytes_subcon(info.subcon):
+            value = f"_encode_bytes({value})"
+        items.append(f"{info.name!r}: {value}")
+
+    source = f"def __cd_encode__(obj):\n    return {{{', '.join(items)}}}"
+    namespace = {"_encode_dataclass": _encode_dataclass, "_encode_bytes": _encode_bytes}
+    exec(compile(source, f"<cd:{model.__name__}>", "exec"), namespace)
+    return namespace["__cd_encode__"]
+
+
+def _encode_dataclass(value):
+    if isinstance(value, list):
+        return [_encode_dataclass(x) for x in value]
+    elif dataclasses.is_dataclass(value):
+        return _class_encoder(type(value))(value)
+
+    return value
+
+
+def _encode_bytes(value):
+    if isinstance(value, memoryview):
+        return value.tobytes()
+    return value
+
+
+def _compile_struct(struct: cs.Construct) -> cs.Construct:
+    # The construct compiler ignores 'parsed' hooks, therefore we keep the
+    # original struct if any of them is present.
+    if _has_parsed_hooks(struct, set()):
+        return struct
+
+    try:
+        return struct.compile()
+    except Exception:
+        # not all sub-constructs can be compiled (e.g. lambda expressions)
+        return struct
+
+
+def _has_parsed_hooks(subcon, visited: set) -> bool:
+    if id(subcon) in visited:
+        return False
+
+    visited.add(id(subcon))
+    if subcon.parsed is not None:
+        return True
+
+    for value in vars(subcon).values():
+        if isinstance(value, dict):
+            value = list(value.values())
+        if not isinstance(value, list):
+            value = [value]
+        for item in value:
+            if isinstance(item, cs.Construct) and _has_parsed_hooks(item, visited):
+                return True
+    return False
+
+
 def _process_struct_dataclass(
-    cls, bitwise=False, depth=None, reverse=False, union=False
+    cls,
+    bitwise=False,
+    depth=None,
+    reverse=False,
+    union=False,
+    compiled=False,
+    slots=False,
 ):
-    new_cls = dataclasses.dataclass(cls)
+    if slots and sys.version_info >= (3, 10):
+        # Slotted instances don't need a __dict__ and provide faster
+        # attribute access when parsed objects are created.
+        new_cls = dataclasses.dataclass(cls, slots=True)
+    else:
+        new_cls = dataclasses.dataclass(cls)
     if hasattr(new_cls, "parser"):
         raise ValueError(
             f"Invalid field definition: field 'parser' alredy exists in class {new_cls}"
@@ -359,12 +660,21 @@ def _process_struct_dataclass(
         )
 
     if bitwise:
-        ds_struct = DataclassBitStruct(cls, depth, reverse, union=union)
+        ds_struct = DataclassBitStruct(
+            new_cls, depth, reverse, union=union, compiled=compiled
+        )
     else:
-        ds_struct = DataclassStruct(cls, depth, reverse, union=union)
+        ds_struct = DataclassStruct(
+            new_cls, depth, reverse, union=union, compiled=compiled
+        )
+
+    struct = ds_struct.subcon
+    if isinstance(struct, cs.Compiled):
+        # The uncompiled struct can be embedded into other constructs
+        struct = struct.defersubcon
 
     setattr(new_cls, "parser", ds_struct)
-    setattr(new_cls, "struct", ds_struct.subcon)
+    setattr(new_cls, "struct", struct)
     return new_cls
 
 
@@ -407,7 +717,15 @@ def container(cls=None, /):
 
 
 def dataclass_struct(
-    cls=None, /, *, bitwise=False, depth=None, reverse=False, union=None
+    cls=None,
+    /,
+    *,
+    bitwise=False,
+    depth=None,
+    reverse=False,
+    union=None,
+    compiled=False,
+    slots=False,
 ):
     """Creates a dataclass that stores a class-parser instance.
 
@@ -430,12 +748,26 @@ def dataclass_struct(
     :type reverse: bool, optional
     :param union: whether the struct should be treated as a union, defaults to False
     :type union: bool, optional
+    :param compiled: whether the struct should be compiled (see :class:`DataclassStruct`
+                     for its limitations), defaults to False
+    :type compiled: bool, optional
+    :param slots: whether the dataclass should define ``__slots__`` (requires
+                  Python 3.10 or newer, ignored otherwise). Slotted classes can't
+                  use zero-argument ``super()`` in their methods and don't accept
+                  attributes that are not declared as fields, defaults to False
+    :type slots: bool, optional
     """
 
     def wrap(cls):
         # Make dataclass and create parser instance
         return _process_struct_dataclass(
-            cls, bitwise=bitwise, depth=depth, reverse=reverse, union=union
+            cls,
+            bitwise=bitwise,
+            depth=depth,
+            reverse=reverse,
+            union=union,
+            compiled=compiled,
+            slots=slots,
         )
 
     # See if we're being called as @struct or @struct().
@@ -454,6 +786,16 @@ class DataclassStruct(cs.Adapter):
     :type depth: int, optional
     :param reverse: whether fields should be processed in reverse order, defaults to False
     :type reverse: bool, optional
+    :param compiled: whether the created struct should be compiled, defaults to False
+    :type compiled: bool, optional
+
+    .. warning::
+        Compiled structs follow the limitations of construct's compiler: 'parsed'
+        hooks are ignored, the context does not provide ``_index`` or ``_io``
+        (e.g. ``Computed(this._index)`` inside an ``Array`` parses to None) and
+        error messages don't contain the path of the failing field. Structs
+        that use 'parsed' hooks or that can't be compiled (e.g. lambda
+        expressions) are used as they are.
 
     Example taken from "construct_typed"::
 
@@ -472,7 +814,13 @@ class DataclassStruct(cs.Adapter):
     """
 
     def __init__(
-        self, model: type, depth=None, reverse=False, aligned=None, union=None
+        self,
+        model: type,
+        depth=None,
+        reverse=False,
+        aligned=None,
+        union=None,
+        compiled=False,
     ) -> None:
         self.model = model
         if not dataclasses.is_dataclass(self.model):
@@ -482,26 +830,227 @@ class DataclassStruct(cs.Adapter):
         self.depth = depth
         self.aligned = aligned
         self.union = union
-        super().__init__(
-            to_struct(self.model, self.depth, self.reverse, self.aligned, self.union)
+        self.compiled = compiled
+        self._zero_copy_struct = None
+        struct = to_struct(
+            self.model, self.depth, self.reverse, self.aligned, self.union
         )
+        if self.compiled:
+            struct = _compile_struct(struct)
+
+        super().__init__(struct)
+        _class_decoder(self.model)
+        _class_encoder(self.model)
+
+    def parse_bytes(self, data, zero_copy=False, **contextkw):
+        """Parses a bytes-like object (bytes, bytearray, memoryview, ...).
+
+        If `zero_copy` is True, fields of the model that are defined as `Bytes`
+        or `GreedyBytes` will store `memoryview` slices of the given data
+        instead of `bytes` objects, so the data must not be modified while
+        parsed objects are in use. All other fields (including nested structs)
+        are parsed as usual. Zero-copy parsing always uses the uncompiled
+        struct.
+
+        :param data: the data to parse
+        :param zero_copy: whether byte fields should reference the given data, defaults to False
+        :type zero_copy: bool, optional
+        :return: the parsed object
+        """
+        if not zero_copy:
+            return self.parse(data, **contextkw)
+
+        if self._zero_copy_struct is None:
+            self._zero_copy_struct = _to_struct_inner(
+                self.model,
+                max_depth=self.depth,
+                reverse=self.reverse,
+                aligned=self.aligned,
+                union=self.union,
+                zero_copy=True,
+            )
+
+        obj = self._zero_copy_struct.parse_stream(_MemoryViewIO(data), **contextkw)
+        return self.model.__cd_decode__(obj)
 
     def _decode(self, obj: cs.Container, context: cs.Context, path: cs.PathType):
-        return to_object(obj, self.model)
+        return self.model.__cd_decode__(obj)
 
     def _encode(self, obj, context: cs.Context, path: cs.PathType) -> dict:
         if isinstance(obj, dict):
             # NOTE: we have to check against a dictionary here as
-            # dataclasses.asdict(obj) will convert nested objects automatically
+            # the generated encoder will convert nested objects automatically
             # into dicts.
             return obj
 
         if not dataclasses.is_dataclass(obj):
             raise TypeError(f"Model class <{type(obj)}> is not a dataclass!")
 
-        return dataclasses.asdict(obj)
+        return _class_encoder(type(obj))(obj)
+
+
+class _MemoryViewIO:
+    # Minimal read-only stream over a memoryview. read() returns copies like
+    # io.BytesIO, read_view() returns slices of the underlying data.
+
+    def __init__(self, data) -> None:
+        self.view = memoryview(data).cast("B")
+        self.offset = 0
+
+    def read_view(self, size=-1) -> memoryview:
+        start = min(self.offset, len(self.view))
+        if size is None or size < 0:
+            end = len(self.view)
+        else:
+            end = min(start + size, len(self.view))
+        self.offset = max(self.offset, end)
+        return self.view[start:end]
+
+    def read(self, size=-1) -> bytes:
+        return self.read_view(size).tobytes()
+
+    def tell(self) -> int:
+        return self.offset
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.offset
+        elif whence == io.SEEK_END:
+            offset += len(self.view)
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+
+        self.offset = offset
+        return offset
+
+    def seekable(self) -> bool:
+        return True
+
+    def readable(self) -> bool:
+        return True
+
+
+class _BytesView(cs.Subconstruct):
+    """Parses `Bytes` or `GreedyBytes` into a memoryview slice of a `_MemoryViewIO`."""
 
+    def _parse(self, stream, context, path):
+        if not isinstance(self.subcon, cs.Bytes):
+            return stream.read_view()
 
-def DataclassBitStruct(model: type, depth=None, reverse=False, union=None):
+        length = cs.evaluate(self.subcon.length, context)
+        if length < 0:
+            raise cs.StreamError(
+                f"length must be non-negative, found {length}", path=path
+            )
+
+        data = stream.read_view(length)
+        if len(data) != length:
+            raise cs.StreamError(
+                f"stream read less than specified amount, expected {length}, "
+                f"found {len(data)}",
+                path=path,
+            )
+        return data
+
+
+def _is_bytes_subcon(subcon) -> bool:
+    # Only plain Bytes and GreedyBytes fields (optionally renamed through
+    # doc/parsed arguments) are parsed into memoryview objects.
+    return isinstance(_unwrap_renamed(subcon), (cs.Bytes, cs.GreedyBytes.__class__))
+
+
+def _zero_copy_subcon(subcon):
+    if not _is_bytes_subcon(subcon):
+        return subcon
+
+    if isinstance(subcon, cs.Renamed):
+        return cs.Renamed(
+            _zero_copy_subcon(subcon.subcon),
+            newname=subcon.name,
+            newdocs=subcon.docs,
+            newparsed=subcon.parsed,
+        )
+    return _BytesView(subcon)
+
+
+def DataclassBitStruct(
+    model: type, depth=None, reverse=False, union=None, compiled=False
+):
     """Makes a DataclassStruct inside a Bitwise."""
-    return cs.Bitwise(DataclassStruct(model, depth=depth, reverse=reverse, union=union))
+    return cs.Bitwise(
+        DataclassStruct(
+            model, depth=depth, reverse=reverse, union=union, compiled=compiled
+        )
+    )
+
+
+class _NumpyArray(cs.Construct):
+    """Parses an `Array` of fixed-size primitive structs into a NumPy array.
+
+    Building accepts a NumPy array or a list of dataclass objects.
+    """
+
+    def __init__(self, subcon: cs.Array) -> None:
+        try:
+            import numpy as np
+        except ImportError as err:
+            raise ImportError("NumPy arrays require the 'numpy' package") from err
+
+        if not isinstance(subcon, cs.Array):
+            raise TypeError(f"Expected an Array subcon, got {subcon}")
+
+        struct = _unwrap_renamed(subcon.subcon)
+        if not isinstance(struct, cs.Struct):
+            raise TypeError(f"Expected an Array of Struct objects, got {struct}")
+
+        dtype = []
+        for sc in struct.subcons:
+            field = _unwrap_renamed(sc)
+            if not sc.name or not isinstance(field, cs.FormatField):
+                raise TypeError(
+                    f"Field {sc.name!r} is not a named primitive number field!"
+                )
+            dtype.append((sc.name, field.fmtstr))
+
+        super().__init__()
+        self.count = subcon.count
+        self.dtype = np.dtype(dtype)
+
+    def _parse(self, stream, context, path):
+        count = cs.evaluate(self.count, context)
+        if count < 0:
+            raise cs.RangeError(f"invalid count {count}", path=path)
+
+        import numpy as np
+
+        data = cs.stream_read(stream, count * self.dtype.itemsize, path)
+        return np.frombuffer(data, dtype=self.dtype, count=count)
+
+    def _build(self, obj, stream, context, path):
+        import numpy as np
+
+        count = cs.evaluate(self.count, context)
+        if not isinstance(obj, np.ndarray):
+            names = self.dtype.names
+            obj = np.array(
+                [tuple(getattr(x, name) for name in names) for x in obj],
+                dtype=self.dtype,
+            )
+
+        if len(obj) != count:
+            raise cs.RangeError(
+                f"expected {count} elements, found {len(obj)}", path=path
+            )
+
+        data = obj.astype(self.dtype, copy=False).tobytes()
+        cs.stream_write(stream, data, len(data), path)
+        return obj
+
+    def _sizeof(self, context, path):
+        return cs.evaluate(self.count, context) * self.dtype.itemsize
+
+
+def _unwrap_renamed(subcon):
+    while isinstance(subcon, cs.Renamed):
+        subcon = subcon.subcon
+    return subcon
@@ -19,7 +19,11 @@ import typing as t
 from construct.core import Context, ContextKWType, FilenameType, PathType, StreamType
 
 def subcsfield(
-    model: type, subcon, doc: str | None = ..., parsed: cs.Context | None = ...
+    model: type,
+    subcon,
+    doc: str | None = ...,
+    parsed: cs.Context | None = ...,
+    numpy: bool = ...,
 ) -> dataclasses.Field: ...
 def csfield(
     subcon: cs.Construct | type,
@@ -58,7 +62,9 @@ def dataclass_struct(
     bitwise: bool = ...,
     depth: int | None = ...,
     reverse: bool = ...,
-    union: t.Union[str, int, None] = ...
+    union: t.Union[str, int, None] = ...,
+    compiled: bool = ...,
+    slots: bool = ...
 ) -> t.Type[T]: ...
 def container(cls: t.Type[T] | None = ...) -> t.Type[T]: ...
 
@@ -68,6 +74,7 @@ class DataclassStruct(cs.Adapter, t.Generic[T]):
     depth: int | None
     aligned: int | None
     union: t.Union[str, int, None]
+    compiled: bool
     def __init__(
         self,
         model: t.Type[T],
@@ -75,8 +82,12 @@ class DataclassStruct(cs.Adapter, t.Generic[T]):
         reverse: bool = ...,
         aligned: int | None = ...,
         union: t.Union[str, int, None] = ...,
+        compiled: bool = ...,
     ) -> None: ...
     def parse(self, data: bytes, **contextkw: ContextKWType) -> t.Union[T, None]: ...
+    def parse_bytes(
+        self, data: t.Any, zero_copy: bool = ..., **contextkw: ContextKWType
+    ) -> t.Union[T, None]: ...
     def parse_file(
         self, filename: FilenameType, **contextkw: ContextKWType
     ) -> t.Union[T, None]: ...
@@ -100,4 +111,5 @@ def DataclassBitStruct(
     depth: int | None = ...,
     reverse: bool = ...,
     union: t.Union[str, int, None] = ...,
+    compiled: bool = ...,
 ): ...
@@ -18,6 +18,7 @@ setup(
     author="MatrixEditor",
     python_requires=">=3.8",
     install_requires=["construct"],
+    extras_require={"numpy": ["numpy"]},
     keywords=[
         "construct",
         "kaitai",
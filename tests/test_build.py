@@ -0,0 +1,27 @@
+import dataclasses
+
+import construct as cs
+
+from construct_dataclasses import DataclassStruct, csfield, to_struct
+
+
+@dataclasses.dataclass
+class Inner:
+    value: int = csfield(cs.Int8ub)
+
+
+def test_build_nested_dataclass_list():
+    @dataclasses.dataclass
+    class Outer:
+        a: list = csfield(cs.Array(2, to_struct(Inner)))
+
+    parser = DataclassStruct(Outer)
+    assert parser.build(Outer(a=[Inner(1), Inner(2)])) == b"\x01\x02"
+
+
+def test_build_nested_dataclass():
+    @dataclasses.dataclass
+    class Outer:
+        inner: Inner = csfield(cs.Padded(2, to_struct(Inner)))
+
+    assert DataclassStruct(Outer).build(Outer(Inner(3))) == b"\x03\x00"
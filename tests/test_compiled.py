@@ -0,0 +1,59 @@
+import enum
+import typing as t
+
+import construct as cs
+
+from construct_dataclasses import (
+    DataclassStruct,
+    csenum,
+    csfield,
+    dataclass_struct,
+    subcsfield,
+    tfield,
+    to_struct,
+)
+
+
+class Feature(enum.IntEnum):
+    WIFI = 1
+    FTP = 3
+
+
+@dataclass_struct
+class Pixel:
+    data: int = csfield(cs.Int8ub)
+
+
+@dataclass_struct
+class Image:
+    magic: bytes = csfield(cs.Const(b"IMG"))
+    feature: Feature = csenum(Feature, cs.Int8ub)
+    count: int = csfield(cs.Int8ub)
+    features: t.List[Feature] = tfield(
+        Feature, cs.Array(cs.this.count, cs.Enum(cs.Int8ub, Feature))
+    )
+    pixels: t.List[Pixel] = subcsfield(Pixel, cs.Array(cs.this.count, to_struct(Pixel)))
+    length: int = csfield(cs.Int16ul)
+    data: bytes = csfield(cs.Bytes(cs.this.length))
+    name: str = csfield(cs.PascalString(cs.Int8ub, "utf8"))
+
+
+DATA = b"IMG\x03\x02\x01\x05\x07\x08\x02\x00ab\x03foo"
+
+
+def test_compiled_parse_matches_uncompiled():
+    compiled = DataclassStruct(Image, compiled=True)
+    uncompiled = DataclassStruct(Image)
+    assert isinstance(compiled.subcon, cs.Compiled)
+    assert not isinstance(uncompiled.subcon, cs.Compiled)
+
+    obj = uncompiled.parse(DATA)
+    assert compiled.parse(DATA) == obj
+    assert obj.features == [Feature.WIFI, 5]
+    assert obj.pixels == [Pixel(7), Pixel(8)]
+    assert compiled.build(obj) == uncompiled.build(obj) == DATA
+
+
+def test_compiled_is_opt_in():
+    assert not isinstance(Image.parser.subcon, cs.Compiled)
+    assert DataclassStruct(Image).compiled is False
@@ -0,0 +1,23 @@
+import dataclasses
+import enum
+import typing as t
+
+import construct as cs
+
+from construct_dataclasses import DataclassStruct, csfield, tfield
+
+
+class Mode(enum.IntEnum):
+    OFF = 0
+    ON = 1
+
+
+def test_bare_list_annotation():
+    @dataclasses.dataclass
+    class Values:
+        a: t.List = csfield(cs.Array(2, cs.Int8ub))
+        modes: t.List[Mode] = tfield(Mode, cs.Array(2, cs.Enum(cs.Int8ub, Mode)))
+
+    obj = DataclassStruct(Values).parse(b"\x01\x02\x01\x05")
+    assert obj.a == [1, 2]
+    assert obj.modes == [Mode.ON, 5]
@@ -0,0 +1,62 @@
+import dataclasses
+
+import construct as cs
+import pytest
+
+from construct_dataclasses import csfield, dataclass_struct, subcsfield, to_struct
+
+np = pytest.importorskip("numpy")
+
+
+@dataclass_struct
+class Pixel:
+    x: int = csfield(cs.Int16ul)
+    y: int = csfield(cs.Int16ub)
+    value: float = csfield(cs.Float32l)
+
+
+@dataclass_struct
+class Image:
+    count: int = csfield(cs.Int8ub)
+    pixels: np.ndarray = subcsfield(
+        Pixel, cs.Array(cs.this.count, to_struct(Pixel)), numpy=True
+    )
+
+
+DATA = b"\x02\x01\x00\x00\x02\x00\x00\x80\x3f\x03\x00\x00\x04\x00\x00\x00\x40"
+
+
+def test_parse_structured_array():
+    image = Image.parser.parse(DATA)
+    assert isinstance(image.pixels, np.ndarray)
+    assert image.pixels.dtype == np.dtype(
+        [("x", "<u2"), ("y", ">u2"), ("value", "<f4")]
+    )
+    assert image.pixels["x"].tolist() == [1, 3]
+    assert image.pixels["y"].tolist() == [2, 4]
+    assert image.pixels["value"].tolist() == [1.0, 2.0]
+
+
+def test_build_from_array_and_objects():
+    image = Image.parser.parse(DATA)
+    assert Image.parser.build(image) == DATA
+
+    pixels = [Pixel(1, 2, 1.0), Pixel(3, 4, 2.0)]
+    assert Image.parser.build(Image(2, pixels)) == DATA
+
+
+def test_build_count_mismatch():
+    with pytest.raises(cs.RangeError):
+        Image.parser.build(Image(3, [Pixel(1, 2, 1.0)]))
+
+
+def test_invalid_subcons():
+    @dataclasses.dataclass
+    class Named:
+        name: str = csfield(cs.PascalString(cs.Int8ub, "utf8"))
+
+    with pytest.raises(TypeError):
+        subcsfield(Named, cs.Array(2, to_struct(Named)), numpy=True)
+
+    with pytest.raises(TypeError):
+        subcsfield(Pixel, cs.Array(2, Pixel.parser), numpy=True)
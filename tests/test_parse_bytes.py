@@ -0,0 +1,92 @@
+import enum
+import io
+
+import construct as cs
+import pytest
+
+from construct_dataclasses import DataclassStruct, csenum, csfield, dataclass_struct
+from construct_dataclasses import _MemoryViewIO
+
+
+class Mode(enum.IntEnum):
+    OFF = 0
+    ON = 1
+
+
+@dataclass_struct
+class Header:
+    version: int = csfield(cs.Int8ub)
+
+
+@dataclass_struct
+class Record:
+    magic: bytes = csfield(cs.Const(b"RC"))
+    number: int = csfield(cs.Int24ub)
+    real: float = csfield(cs.Float32b)
+    varint: int = csfield(cs.VarInt)
+    flag: bool = csfield(cs.Flag)
+    mode: Mode = csenum(Mode, cs.Int8ub)
+    padded: str = csfield(cs.PaddedString(4, "ascii"))
+    cstring: str = csfield(cs.CString("utf8"))
+    pascal: str = csfield(cs.PascalString(cs.Int8ub, "utf8"))
+    bits: dict = csfield(cs.BitStruct("a" / cs.Nibble, "b" / cs.Nibble))
+    prefixed: bytes = csfield(cs.Prefixed(cs.Int8ub, cs.GreedyBytes))
+    pointer: int = csfield(cs.Pointer(0, cs.Int8ub))
+    hexed: bytes = csfield(cs.Hex(cs.Bytes(2)))
+    header: Header = csfield(Header)
+    length: int = csfield(cs.Int8ub)
+    data: bytes = csfield(cs.Bytes(cs.this.length), doc="payload")
+    rest: bytes = csfield(cs.GreedyBytes)
+
+
+DATA = (
+    b"RC\x00\x01\x02\x00\x00\x00\x00\x81\x01\x01\x01ab\x00\x00cd\x00\x03efg"
+    b"\x12\x02hi\xbe\xef\x07\x02xyREST"
+)
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_zero_copy_matches_parse(compiled):
+    parser = DataclassStruct(Record, compiled=compiled)
+    expected = DataclassStruct(Record).parse(DATA)
+    obj = parser.parse_bytes(DATA, zero_copy=True)
+    assert obj == expected
+    assert obj == parser.parse(DATA)
+
+    assert isinstance(obj.data, memoryview)
+    assert isinstance(obj.rest, memoryview)
+    assert obj.data == b"xy" and obj.rest == b"REST"
+    for name in ("magic", "prefixed", "hexed"):
+        assert type(getattr(obj, name)) is type(getattr(expected, name))
+
+    assert obj.pascal == "efg"
+    assert obj.mode is Mode.ON
+    assert obj.header == Header(7)
+    assert parser.build(obj) == DATA
+
+
+def test_zero_copy_references_data():
+    data = bytearray(DATA)
+    obj = Record.parser.parse_bytes(data, zero_copy=True)
+    data[-1:] = b"!"
+    assert obj.rest == b"RES!"
+
+
+def test_parse_bytes_copies_by_default():
+    obj = Record.parser.parse_bytes(memoryview(DATA))
+    assert type(obj.data) is bytes and obj.data == b"xy"
+
+
+def test_zero_copy_short_read():
+    with pytest.raises(cs.StreamError):
+        Record.parser.parse_bytes(DATA[:-6], zero_copy=True)
+
+
+def test_read_after_seek_past_end():
+    stream = _MemoryViewIO(b"abc")
+    stream.seek(10)
+    assert stream.read(2) == b""
+    assert stream.tell() == 10
+    stream.seek(-1, io.SEEK_END)
+    assert stream.read() == b"c"
+    assert stream.tell() == 3
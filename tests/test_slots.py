@@ -0,0 +1,34 @@
+import sys
+
+import construct as cs
+import pytest
+
+from construct_dataclasses import csfield, dataclass_struct
+
+
+@dataclass_struct
+class Point:
+    x: int = csfield(cs.Int8ub)
+
+    def __repr__(self):
+        return "Point:" + super().__repr__()
+
+
+def test_slots_are_opt_in():
+    point = Point.parser.parse(b"\x01")
+    assert not hasattr(Point, "__slots__")
+    assert repr(point).startswith("Point:<")
+    point.extra = 2
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires Python 3.10")
+def test_slots_opt_in():
+    @dataclass_struct(slots=True)
+    class Slotted:
+        x: int = csfield(cs.Int8ub)
+
+    assert Slotted.__slots__ == ("x",)
+    obj = Slotted.parser.parse(b"\x01")
+    assert obj == Slotted(1)
+    with pytest.raises(AttributeError):
+        obj.extra = 2
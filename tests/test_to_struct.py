@@ -0,0 +1,30 @@
+import construct as cs
+
+from construct_dataclasses import DataclassStruct, csfield, dataclass_struct, to_struct
+
+
+@dataclass_struct
+class Value:
+    number: int = csfield(cs.Int16ub)
+    small: int = csfield(cs.Int8ub)
+
+
+def test_to_struct_is_cached():
+    assert to_struct(Value) is to_struct(Value)
+    assert to_struct(Value, union=True) is not to_struct(Value, union=1)
+
+
+def test_union_expression():
+    struct = to_struct(Value, union=cs.this._.k)
+    assert isinstance(struct, cs.Union)
+    assert struct.parse(b"\x01\x02", k=1) == dict(number=0x0102, small=1)
+
+    parser = DataclassStruct(Value, union=cs.this._.k)
+    assert parser.parse(b"\x01\x02", k="number") == Value(0x0102, 1)
+
+    @dataclass_struct(union=cs.this._.k)
+    class Other:
+        number: int = csfield(cs.Int16ub)
+        small: int = csfield(cs.Int8ub)
+
+    assert Other.parser.parse(b"\x01\x02", k=0) == Other(0x0102, 1)